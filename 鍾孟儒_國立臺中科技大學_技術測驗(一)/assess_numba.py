@@ -0,0 +1,175 @@
+from array import array
+from typing import List, Sequence
+import random
+import sys
+
+import main
+
+
+# ===========================
+# 選用加速模組 (Optional Numba Acceleration)
+# ===========================
+#
+# 大量案例（例如模糊測試、性質測試）批次評估時，以 Numba JIT 編譯的平行迴圈取代
+# main.assess_batch() 的 Python 迴圈。numba 為選用套件：未安裝時自動退回
+# main.assess_batch()，輸入與輸出格式完全相同。
+
+try:
+    import numba
+    import numpy as np
+except ImportError:
+    numba = None
+    np = None
+
+
+if numba is not None:
+    @numba.njit(parallel=True, cache=True)
+    def _assess_batch_nb(areas, pains, exudate_codes, out_status,
+                         critical_area, critical_pain, good_area, good_pain,
+                         heavy_code, light_code):
+        """
+        逐筆計算狀態碼並寫入 out_status（0=Good, 1=Warning, 2=Critical）
+
+        閾值以參數傳入而非讀取全域常量：Numba 會將全域值凍結進磁碟快取，
+        若 main.py 的閾值變更，快取不會隨之失效。
+        """
+        for i in numba.prange(areas.shape[0]):
+            if (areas[i] > critical_area
+                    or pains[i] > critical_pain
+                    or exudate_codes[i] == heavy_code):
+                out_status[i] = 2
+            elif (areas[i] < good_area
+                    and pains[i] < good_pain
+                    and exudate_codes[i] <= light_code):
+                out_status[i] = 0
+            else:
+                out_status[i] = 1
+
+
+def assess_batch(areas: Sequence[float], pains: Sequence[float], exudate_codes: Sequence[int]) -> "array[int]":
+    """
+    批次計算多筆傷口指標的評估狀態碼（Numba 加速版）
+
+    介面與 main.assess_batch() 相同；未安裝 numba 時直接委派給 main.assess_batch()。
+
+    Args:
+        areas: 傷口面積序列（cm²），已通過驗證
+        pains: 疼痛等級序列（0-10），已通過驗證
+        exudate_codes: 滲液量編碼序列（見 main.EXUDATE_CODES）
+
+    Returns:
+        array: 狀態碼陣列（typecode "b"），0=Good, 1=Warning, 2=Critical（見 main.STATUS_CODES）
+
+    Raises:
+        ValueError: 三個序列長度不一致時；JIT 核心不做邊界檢查，必須在轉為 NumPy 陣列前攔下
+    """
+    if not len(areas) == len(pains) == len(exudate_codes):
+        raise ValueError(
+            "areas、pains、exudate_codes 長度必須相同"
+            f"（{len(areas)}, {len(pains)}, {len(exudate_codes)}）"
+        )
+
+    if numba is None:
+        return main.assess_batch(areas, pains, exudate_codes)
+
+    if len(areas) == 0:
+        return array("b")
+
+    # array("d") / array("b") 透過 buffer protocol 直接轉為 NumPy 陣列，不需複製
+    areas_np = np.asarray(areas, dtype=np.float64)
+    pains_np = np.asarray(pains, dtype=np.float64)
+    exudate_codes_np = np.asarray(exudate_codes, dtype=np.int8)
+
+    # 結果直接寫入 array("b") 的記憶體，回傳型別與 main.assess_batch() 一致
+    out_status = array("b", bytes(areas_np.shape[0]))
+    _assess_batch_nb(
+        areas_np, pains_np, exudate_codes_np, np.frombuffer(out_status, dtype=np.int8),
+        main.CRITICAL_WOUND_AREA_THRESHOLD, main.CRITICAL_PAIN_LEVEL_THRESHOLD,
+        main.GOOD_WOUND_AREA_THRESHOLD, main.GOOD_PAIN_LEVEL_THRESHOLD,
+        main.EXUDATE_CODES["Heavy"], main.EXUDATE_CODES["Light"]
+    )
+    return out_status
+
+
+# 載入模組時先以單筆資料觸發編譯（或載入磁碟快取），避免首次呼叫計入 JIT 編譯時間
+if numba is not None:
+    assess_batch(array("d", [0.0]), array("d", [0.0]), array("b", [0]))
+
+
+# ===========================
+# 一致性自我檢查 (Parity Self-Check)
+# ===========================
+
+def _self_check(case_count: int = 100_000, seed: int = 0) -> List[int]:
+    """
+    檢查本模組的 assess_batch() 與 main.assess_batch()、main.assess() 的判斷結果一致
+
+    Numba 核心另行實作了一份閾值判斷邏輯，以此檢查防止三者日後不同步。
+    除隨機案例外，另涵蓋所有閾值的邊界值（等於閾值及其前後一點），
+    並確認兩種實作在輸入長度不一致時皆拋出 ValueError。
+
+    Args:
+        case_count: 隨機案例數
+        seed: 亂數種子（固定以便重現）
+
+    Returns:
+        List[int]: 結果不一致的案例索引（空清單表示全部一致；-1 表示長度檢查失效）
+    """
+    rng = random.Random(seed)
+    exudate_levels = tuple(main.EXUDATE_CODES)
+
+    # 邊界值：各閾值本身及其前後一點
+    boundary_areas = [0.0]
+    for threshold in (main.GOOD_WOUND_AREA_THRESHOLD, main.CRITICAL_WOUND_AREA_THRESHOLD):
+        boundary_areas += [threshold - 0.01, float(threshold), threshold + 0.01]
+    boundary_pains = [0.0, 10.0]
+    for threshold in (main.GOOD_PAIN_LEVEL_THRESHOLD, main.CRITICAL_PAIN_LEVEL_THRESHOLD):
+        boundary_pains += [threshold - 0.01, float(threshold), threshold + 0.01]
+
+    cases = [
+        (area, pain, level)
+        for area in boundary_areas for pain in boundary_pains for level in exudate_levels
+    ]
+    cases += [
+        (rng.uniform(0, 8), rng.uniform(0, 10), rng.choice(exudate_levels))
+        for _ in range(case_count)
+    ]
+
+    areas = array("d", [area for area, _, _ in cases])
+    pains = array("d", [pain for _, pain, _ in cases])
+    exudate_codes = array("b", [main.EXUDATE_CODES[level] for _, _, level in cases])
+
+    accelerated = assess_batch(areas, pains, exudate_codes)
+    reference = main.assess_batch(areas, pains, exudate_codes)
+
+    mismatches = [
+        index for index, (area, pain, level) in enumerate(cases)
+        if not (accelerated[index] == reference[index]
+                == main.STATUS_CODES.index(main.assess(area, pain, level)["status"]))
+    ]
+
+    # 長度不一致：兩種實作都必須拋出 ValueError，而非越界讀取或靜默截斷（以索引 -1 回報）
+    mismatched_inputs = (
+        (areas[:-1], pains, exudate_codes),
+        (areas, pains[:-1], exudate_codes),
+        (areas, pains, exudate_codes[:-1]),
+    )
+    for batch_fn in (assess_batch, main.assess_batch):
+        for batch_areas, batch_pains, batch_exudate_codes in mismatched_inputs:
+            try:
+                batch_fn(batch_areas, batch_pains, batch_exudate_codes)
+            except ValueError:
+                continue
+            mismatches.append(-1)
+
+    return mismatches
+
+
+# 直接執行此檔案時進行一致性檢查：python assess_numba.py
+if __name__ == "__main__":
+    backend = "numba" if numba is not None else "純 Python（未安裝 numba）"
+    mismatches = _self_check()
+    if mismatches:
+        print(f"一致性檢查失敗（{backend}）：{len(mismatches)} 個案例結果不一致，例如索引 {mismatches[:5]}")
+        sys.exit(1)
+    print(f"一致性檢查通過（{backend}）")
@@ -1,5 +1,12 @@
-from typing import Dict, List, Tuple
+from array import array
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, List, Mapping, Optional, Sequence, TextIO, Tuple, TypedDict
+import argparse
+import io
 import math
+import sys
+import traceback
 
 
 # ===========================
@@ -9,6 +16,22 @@ import math
 # 滲液量有效值集合
 VALID_EXUDATE_LEVELS = {"None", "Light", "Moderate", "Heavy"}
 
+# 滲液量正規化對照表（casefold 後 -> 標準寫法），驗證與正規化一次查表完成
+_EXUDATE_MAP = {level.casefold(): level for level in VALID_EXUDATE_LEVELS}
+
+# float() 可接受的純字母字串（casefold 後）；其餘純字母字串必定無法轉為數字
+_FLOAT_WORDS = frozenset({"inf", "infinity", "nan"})
+
+# 滲液量整數編碼（供批次評估使用，數值越大代表滲液越多）
+EXUDATE_CODES = {"None": 0, "Light": 1, "Moderate": 2, "Heavy": 3}
+
+# 批次判斷使用的滲液量編碼（於載入模組時取出，避免每筆查表）
+_HEAVY_CODE = EXUDATE_CODES["Heavy"]
+_LIGHT_CODE = EXUDATE_CODES["Light"]
+
+# 評估狀態整數編碼（索引即狀態碼：0=Good, 1=Warning, 2=Critical）
+STATUS_CODES = ("Good", "Warning", "Critical")
+
 # Critical 狀態判斷閾值
 CRITICAL_WOUND_AREA_THRESHOLD = 5      # cm²
 CRITICAL_PAIN_LEVEL_THRESHOLD = 7      # 0-10 scale
@@ -17,12 +40,60 @@ CRITICAL_PAIN_LEVEL_THRESHOLD = 7      # 0-10 scale
 GOOD_WOUND_AREA_THRESHOLD = 2          # cm²
 GOOD_PAIN_LEVEL_THRESHOLD = 3          # 0-10 scale
 
+# Critical 判斷理由（閾值為常量，於載入模組時預先產生字串）
+_REASON_AREA = f"傷口面積大於 {CRITICAL_WOUND_AREA_THRESHOLD} cm²"
+_REASON_PAIN = f"疼痛等級高於 {CRITICAL_PAIN_LEVEL_THRESHOLD}"
+_REASON_HEAVY = "滲液量為 Heavy"
+
+# Critical 理由組合表：以觸發條件的位元遮罩索引（bit 0=面積, bit 1=疼痛, bit 2=滲液），共 2³ 種組合
+_CRITICAL_REASONS = tuple(
+    tuple(reason for bit, reason in enumerate((_REASON_AREA, _REASON_PAIN, _REASON_HEAVY)) if mask >> bit & 1)
+    for mask in range(8)
+)
+
+# 評估結果範本（唯讀；Critical 的理由依觸發條件另行產生）
+_GOOD_RESULT: Mapping[str, Any] = MappingProxyType({
+    "status": "Good",
+    "reasons": ("指標皆在穩定範圍",),
+    "advice": "目前傷口狀況穩定，建議持續基本清潔與定期觀察。"
+})
+_WARNING_RESULT: Mapping[str, Any] = MappingProxyType({
+    "status": "Warning",
+    "reasons": ("介於 Good 與 Critical 之間，需持續追蹤",),
+    "advice": "傷口狀況需注意，建議增加觀察頻率並留意疼痛與滲液變化。"
+})
+
+# Critical 結果的固定欄位（每次依理由組合建立新物件，不經由範本展開）
+_CRITICAL_STATUS = "Critical"
+_CRITICAL_ADVICE = "傷口屬高風險狀態，建議儘速由專業醫療人員進行評估。"
+
+# 驗證失敗時 _assess_wound_core() 返回的空白評估結果（佔位用）
+_NO_RESULT: Mapping[str, Any] = MappingProxyType({})
+
+
+# ===========================
+# 型別定義區 (Type Definitions)
+# ===========================
+
+class AssessmentData(TypedDict):
+    """assess_wound_api() 成功時 data 欄位的結構"""
+    status: str             # Good/Warning/Critical
+    reasons: List[str]      # 判斷理由清單
+    advice: str             # 照護建議
+
+
+class ApiResponse(TypedDict, total=False):
+    """assess_wound_api() 的標準化返回格式：成功時含 data，失敗時含 error"""
+    success: bool
+    data: AssessmentData
+    error: str
+
 
 # ===========================
 # 輸入驗證層 (Validation Layer)
 # ===========================
 
-def validate_inputs(wound_area, pain_level, exudate_level) -> Tuple[bool, str, float, float, str]:
+def validate_inputs(wound_area: Any, pain_level: Any, exudate_level: Any) -> Tuple[bool, str, float, float, str]:
     """
     驗證傷口評估輸入參數的有效性
 
@@ -42,50 +113,94 @@ def validate_inputs(wound_area, pain_level, exudate_level) -> Tuple[bool, str, f
         - 若驗證失敗：(False, "錯誤訊息", 0.0, 0.0, "")
     """
     # ===== 驗證 woundArea =====
-    # 必須為數字且 >= 0
-    try:
-        wound_area_float = float(wound_area)
-    except (TypeError, ValueError):
+    # 必須為數字且 >= 0；已是 float 時直接使用，int 與 str 直接轉換，其餘型別才經過泛用轉換
+    wound_area_type = type(wound_area)
+    if wound_area_type is float:
+        wound_area_float = wound_area
+    elif wound_area_type is int:
+        # int 直接轉為 float，不需經過泛用的例外處理路徑；超出浮點數範圍的整數（例如 10**400）視為非有限數值
+        try:
+            wound_area_float = float(wound_area)
+        except OverflowError:
+            return False, "woundArea 必須為有限數值", 0.0, 0.0, ""
+    elif wound_area_type is str:
+        # 純字母字串（例如 "abc"）必定無法轉換，先行排除以免 float() 拋出例外；
+        # 僅用一次 isalpha() 篩選，合法數字字串幾乎不增加成本，其餘無效字串仍由 float() 判斷
+        if wound_area.isalpha() and wound_area.casefold() not in _FLOAT_WORDS:
+            return False, "woundArea 必須為數字", 0.0, 0.0, ""
+        try:
+            wound_area_float = float(wound_area)
+        except ValueError:
+            return False, "woundArea 必須為數字", 0.0, 0.0, ""
+    elif wound_area is None:
         return False, "woundArea 必須為數字", 0.0, 0.0, ""
-
-    # 檢查是否為有限數值（排除 inf, -inf, nan）
-    if not math.isfinite(wound_area_float):
-        return False, "woundArea 必須為有限數值", 0.0, 0.0, ""
-
-    # 檢查非負數
-    if wound_area_float < 0:
+    else:
+        try:
+            wound_area_float = float(wound_area)
+        except (TypeError, ValueError):
+            return False, "woundArea 必須為數字", 0.0, 0.0, ""
+        except OverflowError:
+            # 超出浮點數範圍的其他數值型別（例如 Decimal("1e400")）
+            return False, "woundArea 必須為有限數值", 0.0, 0.0, ""
+
+    # 檢查非負且為有限數值：上方各分支皆已轉為 float（超出範圍的整數已被拒絕），
+    # nan 與任何數比較皆為 False，單一連續比較即可排除 nan, inf, -inf 與負數
+    if not (0 <= wound_area_float < math.inf):
+        # 僅在驗證失敗時才區分原因，以提供明確的錯誤訊息
+        if not math.isfinite(wound_area_float):
+            return False, "woundArea 必須為有限數值", 0.0, 0.0, ""
         return False, "woundArea 不可為負數", 0.0, 0.0, ""
 
     # ===== 驗證 painLevel =====
-    # 必須為 0~10 範圍內的數字
-    try:
-        pain_level_float = float(pain_level)
-    except (TypeError, ValueError):
+    # 必須為 0~10 範圍內的數字；與 woundArea 相同的型別快速路徑
+    pain_level_type = type(pain_level)
+    if pain_level_type is float:
+        pain_level_float = pain_level
+    elif pain_level_type is int:
+        # int 直接轉為 float，不需經過泛用的例外處理路徑；超出浮點數範圍的整數（例如 10**400）視為非有限數值
+        try:
+            pain_level_float = float(pain_level)
+        except OverflowError:
+            return False, "painLevel 必須為有限數值", 0.0, 0.0, ""
+    elif pain_level_type is str:
+        # 純字母字串（例如 "abc"）必定無法轉換，先行排除以免 float() 拋出例外；
+        # 僅用一次 isalpha() 篩選，合法數字字串幾乎不增加成本，其餘無效字串仍由 float() 判斷
+        if pain_level.isalpha() and pain_level.casefold() not in _FLOAT_WORDS:
+            return False, "painLevel 必須為數字", 0.0, 0.0, ""
+        try:
+            pain_level_float = float(pain_level)
+        except ValueError:
+            return False, "painLevel 必須為數字", 0.0, 0.0, ""
+    elif pain_level is None:
         return False, "painLevel 必須為數字", 0.0, 0.0, ""
-
-    # 檢查是否為有限數值
-    if not math.isfinite(pain_level_float):
-        return False, "painLevel 必須為有限數值", 0.0, 0.0, ""
-
-    # 檢查範圍 [0, 10]
-    if pain_level_float < 0 or pain_level_float > 10:
+    else:
+        try:
+            pain_level_float = float(pain_level)
+        except (TypeError, ValueError):
+            return False, "painLevel 必須為數字", 0.0, 0.0, ""
+        except OverflowError:
+            # 超出浮點數範圍的其他數值型別（例如 Decimal("1e400")）
+            return False, "painLevel 必須為有限數值", 0.0, 0.0, ""
+
+    # 檢查範圍 [0, 10]：同樣只會收到 float，以單一連續比較排除 nan, inf, -inf 與超出範圍的數值
+    if not (0 <= pain_level_float <= 10):
+        if not math.isfinite(pain_level_float):
+            return False, "painLevel 必須為有限數值", 0.0, 0.0, ""
         return False, "painLevel 超出範圍（0~10）", 0.0, 0.0, ""
 
     # ===== 驗證 exudateLevel =====
-    # 必須為預定義的有效值之一
-    if not isinstance(exudate_level, str):
+    # 必須為預定義的有效值之一：去除前後空白、轉小寫後查表
+    # （例如：light -> Light, " HEAVY " -> Heavy）；非字串沒有 strip/casefold 方法
+    try:
+        exudate_level_folded = exudate_level.strip().casefold()
+    except AttributeError:
         return False, "exudateLevel 必須為字串（None/Light/Moderate/Heavy）", 0.0, 0.0, ""
 
-    # 檢查非空（去除前後空白後）
-    exudate_level_stripped = exudate_level.strip()
-    if not exudate_level_stripped:
-        return False, "exudateLevel 不可為空", 0.0, 0.0, ""
-
-    # 正規化：首字母大寫，其餘小寫（例如：light -> Light, HEAVY -> Heavy）
-    exudate_level_normalized = exudate_level_stripped.capitalize()
-
-    # 檢查是否在有效值集合中
-    if exudate_level_normalized not in VALID_EXUDATE_LEVELS:
+    exudate_level_normalized = _EXUDATE_MAP.get(exudate_level_folded)
+    if exudate_level_normalized is None:
+        # 區分空字串與無效值，以提供明確的錯誤訊息
+        if not exudate_level_folded:
+            return False, "exudateLevel 不可為空", 0.0, 0.0, ""
         return False, "exudateLevel 不在允許值（None/Light/Moderate/Heavy）", 0.0, 0.0, ""
 
     # 所有驗證通過
@@ -96,7 +211,7 @@ def validate_inputs(wound_area, pain_level, exudate_level) -> Tuple[bool, str, f
 # 業務邏輯層 (Business Logic Layer)
 # ===========================
 
-def assess(wound_area: float, pain_level: float, exudate_level: str) -> Dict[str, object]:
+def assess(wound_area: float, pain_level: float, exudate_level: str) -> Mapping[str, Any]:
     """
     根據傷口指標進行風險評估
 
@@ -116,55 +231,78 @@ def assess(wound_area: float, pain_level: float, exudate_level: str) -> Dict[str
         exudate_level: 滲液量（None/Light/Moderate/Heavy），已通過驗證的字串
 
     Returns:
-        Dict: 包含以下鍵值
+        Mapping: 包含以下鍵值
             - status (str): 評估狀態 (Good/Warning/Critical)
-            - reasons (List[str]): 判斷理由清單
+            - reasons (Sequence[str]): 判斷理由清單
             - advice (str): 照護建議
+        reasons 一律為共用的 tuple。Good/Warning 返回共用的唯讀範本（MappingProxyType）；
+        Critical 的理由依輸入而定，每次返回新的 dict。
     """
-    reasons: List[str] = []
+    # Critical 觸發條件的位元遮罩（bit 0=面積, bit 1=疼痛, bit 2=滲液），僅計算一次
+    mask = ((wound_area > CRITICAL_WOUND_AREA_THRESHOLD)
+            | ((pain_level > CRITICAL_PAIN_LEVEL_THRESHOLD) << 1)
+            | ((exudate_level == "Heavy") << 2))
+    if mask:
+        return {
+            "status": _CRITICAL_STATUS,
+            "reasons": _CRITICAL_REASONS[mask],
+            "advice": _CRITICAL_ADVICE
+        }
 
-    # ========================================
-    # 第一優先：檢查 Critical 狀態（任一條件符合即觸發）
-    # ========================================
-    if wound_area > CRITICAL_WOUND_AREA_THRESHOLD:
-        reasons.append(f"傷口面積大於 {CRITICAL_WOUND_AREA_THRESHOLD} cm²")
+    # 未觸發 Critical 時才檢查 Good 條件；Good/Warning 直接返回共用的唯讀範本
+    if (wound_area < GOOD_WOUND_AREA_THRESHOLD
+            and pain_level < GOOD_PAIN_LEVEL_THRESHOLD
+            and exudate_level in ("None", "Light")):
+        return _GOOD_RESULT
+    return _WARNING_RESULT
 
-    if pain_level > CRITICAL_PAIN_LEVEL_THRESHOLD:
-        reasons.append(f"疼痛等級高於 {CRITICAL_PAIN_LEVEL_THRESHOLD}")
 
-    if exudate_level == "Heavy":
-        reasons.append("滲液量為 Heavy")
+def assess_batch(areas: Sequence[float], pains: Sequence[float], exudate_codes: Sequence[int]) -> "array[int]":
+    """
+    批次計算多筆傷口指標的評估狀態碼
 
-    # 若有任何 Critical 條件觸發，立即返回 Critical 狀態
-    if reasons:
-        return {
-            "status": "Critical",
-            "reasons": reasons,
-            "advice": "傷口屬高風險狀態，建議儘速由專業醫療人員進行評估。"
-        }
+    輸入採用「欄位分離」（Structure of Arrays）的形式：三個等長序列分別存放
+    面積、疼痛等級與滲液量編碼，建議使用 array("d") / array("b") 以取得連續記憶體。
+    判斷標準與 assess() 完全相同，但只計算狀態碼，不建立結果字典。
 
-    # ========================================
-    # 第二優先：檢查 Good 狀態（所有條件必須同時符合）
-    # ========================================
-    is_area_good = wound_area < GOOD_WOUND_AREA_THRESHOLD
-    is_pain_good = pain_level < GOOD_PAIN_LEVEL_THRESHOLD
-    is_exudate_good = exudate_level in ("None", "Light")
+    Args:
+        areas: 傷口面積序列（cm²），已通過驗證
+        pains: 疼痛等級序列（0-10），已通過驗證
+        exudate_codes: 滲液量編碼序列（見 EXUDATE_CODES）
 
-    if is_area_good and is_pain_good and is_exudate_good:
-        return {
-            "status": "Good",
-            "reasons": ["指標皆在穩定範圍"],
-            "advice": "目前傷口狀況穩定，建議持續基本清潔與定期觀察。"
-        }
+    Returns:
+        array: 狀態碼陣列（typecode "b"），0=Good, 1=Warning, 2=Critical（見 STATUS_CODES）
 
-    # ========================================
-    # 預設：Warning 狀態（介於 Good 和 Critical 之間）
-    # ========================================
-    return {
-        "status": "Warning",
-        "reasons": ["介於 Good 與 Critical 之間，需持續追蹤"],
-        "advice": "傷口狀況需注意，建議增加觀察頻率並留意疼痛與滲液變化。"
-    }
+    Raises:
+        ValueError: 三個序列長度不一致時（避免 zip() 靜默截斷多出的資料）
+    """
+    if not len(areas) == len(pains) == len(exudate_codes):
+        raise ValueError(
+            "areas、pains、exudate_codes 長度必須相同"
+            f"（{len(areas)}, {len(pains)}, {len(exudate_codes)}）"
+        )
+
+    return array("b", [
+        _status_code(area, pain, exudate_code)
+        for area, pain, exudate_code in zip(areas, pains, exudate_codes)
+    ])
+
+
+def _status_code(wound_area: float, pain_level: float, exudate_code: int) -> int:
+    """
+    計算單筆指標的狀態碼（0=Good, 1=Warning, 2=Critical）
+
+    Critical 條件優先判斷；Good 需三項條件同時成立；其餘皆為 Warning。
+    滲液量以整數編碼比較：Heavy = 3，None/Light <= 1。
+    各條件以位元運算合併為布林遮罩，避免逐條件分支。
+    """
+    crit_mask = ((wound_area > CRITICAL_WOUND_AREA_THRESHOLD)
+                 | (pain_level > CRITICAL_PAIN_LEVEL_THRESHOLD)
+                 | (exudate_code == _HEAVY_CODE))
+    good_mask = ((wound_area < GOOD_WOUND_AREA_THRESHOLD)
+                 & (pain_level < GOOD_PAIN_LEVEL_THRESHOLD)
+                 & (exudate_code <= _LIGHT_CODE))
+    return 2 if crit_mask else (0 if good_mask else 1)
 
 
 # ===========================
@@ -181,15 +319,14 @@ def format_error_output(error_message: str) -> str:
     Returns:
         str: 格式化後的錯誤訊息（簡潔清晰的文字格式）
     """
-    lines = [
-        "評估狀態：Input Error",
-        f"原因：{error_message}",
+    return (
+        "評估狀態：Input Error\n"
+        f"原因：{error_message}\n"
         "照護建議：輸入資料不正確，請確認數值與格式後重新輸入。"
-    ]
-    return "\n".join(lines)
+    )
 
 
-def format_assessment_output(result: Dict[str, object]) -> str:
+def format_assessment_output(result: Mapping[str, Any]) -> str:
     """
     格式化評估結果輸出
 
@@ -199,36 +336,32 @@ def format_assessment_output(result: Dict[str, object]) -> str:
     Returns:
         str: 格式化後的評估結果（簡潔清晰的文字格式）
     """
-    lines = [
-        f"評估狀態：{result['status']}",
-        "判斷理由："
-    ]
+    # 固定結構（狀態、理由、建議）以單一 f-string 組成，只有理由清單需要 join
+    reasons = result["reasons"]
+    reasons_block = "\n  - " + "\n  - ".join(reasons) if reasons else ""
 
-    # 添加所有判斷理由（使用項目符號）
-    for reason in result["reasons"]:
-        lines.append(f"  - {reason}")
-
-    # 添加照護建議
-    lines.append(f"照護建議：{result['advice']}")
-
-    return "\n".join(lines)
+    return (
+        f"評估狀態：{result['status']}\n"
+        f"判斷理由：{reasons_block}\n"
+        f"照護建議：{result['advice']}"
+    )
 
 
 # ===========================
 # API 介面層 (API Interface Layer)
 # ===========================
 
-def assess_wound_api(wound_area, pain_level, exudate_level) -> Dict[str, object]:
+def assess_wound_api(wound_area: Any, pain_level: Any, exudate_level: Any) -> ApiResponse:
     """
     傷口評估統一 API 介面
 
     此函數為系統的主要入口點，整合了輸入驗證和業務邏輯評估。
     採用標準化的返回格式，便於外部系統整合。
 
-    處理流程：
+    處理流程（步驟 1~3 由 _assess_wound_core() 執行）：
     1. 呼叫 validate_inputs() 驗證輸入參數
     2. 若驗證失敗，返回錯誤訊息
-    3. 若驗證成功，呼叫 assess() 進行評估
+    3. 若驗證成功，呼叫 assess() 進行評估（經 _assess_cached() 快取）
     4. 返回標準化的評估結果
 
     Args:
@@ -237,7 +370,7 @@ def assess_wound_api(wound_area, pain_level, exudate_level) -> Dict[str, object]
         exudate_level: 滲液量（任意型別，會進行驗證）
 
     Returns:
-        Dict: 標準化的 API 返回格式
+        ApiResponse: 標準化的 API 返回格式（dict）
             成功時：
                 {
                     "success": True,
@@ -253,181 +386,236 @@ def assess_wound_api(wound_area, pain_level, exudate_level) -> Dict[str, object]
                     "error": str            # 錯誤訊息
                 }
     """
-    # 步驟 1: 輸入驗證
-    is_valid, error_msg, wound_area_validated, pain_level_validated, exudate_level_validated = \
-        validate_inputs(wound_area, pain_level, exudate_level)
+    is_valid, error_msg, assessment_result = _assess_wound_core(wound_area, pain_level, exudate_level)
 
-    # 步驟 2: 驗證失敗處理
+    # 驗證失敗：返回錯誤訊息
     if not is_valid:
         return {
             "success": False,
             "error": error_msg
         }
 
-    # 步驟 3: 執行業務邏輯評估（使用正規化後的 exudate_level）
-    assessment_result = assess(wound_area_validated, pain_level_validated, exudate_level_validated)
-
-    # 步驟 4: 返回成功結果
+    # 評估成功：將（可能為快取共用的）評估結果複製為標準化的 dict 格式
     return {
         "success": True,
-        "data": assessment_result
+        "data": {
+            "status": assessment_result["status"],
+            "reasons": list(assessment_result["reasons"]),
+            "advice": assessment_result["advice"]
+        }
     }
 
 
+def _assess_wound_core(wound_area: Any, pain_level: Any, exudate_level: Any) -> Tuple[bool, str, Mapping[str, Any]]:
+    """
+    傷口評估核心流程：驗證輸入後進行評估，不建立 API 外層的 dict
+
+    供內部呼叫端（例如 run_single_case()）直接使用；需要標準化返回格式時請改用 assess_wound_api()。
+
+    Args:
+        wound_area: 傷口面積（任意型別，會進行驗證轉換）
+        pain_level: 疼痛等級（任意型別，會進行驗證轉換）
+        exudate_level: 滲液量（任意型別，會進行驗證）
+
+    Returns:
+        Tuple[bool, str, Mapping]: (驗證是否通過, 錯誤訊息, 評估結果；經快取共用，不可修改)
+        - 若驗證通過：(True, "", assess() 的評估結果)
+        - 若驗證失敗：(False, "錯誤訊息", 空的唯讀 Mapping)
+    """
+    # 步驟 1: 輸入驗證
+    is_valid, error_msg, wound_area_validated, pain_level_validated, exudate_level_validated = \
+        validate_inputs(wound_area, pain_level, exudate_level)
+
+    # 步驟 2: 驗證失敗處理
+    if not is_valid:
+        return False, error_msg, _NO_RESULT
+
+    # 步驟 3: 執行業務邏輯評估（使用正規化後的 exudate_level，相同輸入直接取用快取）
+    return True, "", _assess_cached(wound_area_validated, pain_level_validated, exudate_level_validated)
+
+
+@lru_cache(maxsize=256)
+def _assess_cached(wound_area: float, pain_level: float, exudate_level: str) -> Mapping[str, Any]:
+    """
+    具快取的 assess()，供 _assess_wound_core() 使用
+
+    評估為純函數，相同的（已驗證）輸入必得相同結果，因此以 lru_cache 記憶化。
+    快取的結果會在多次呼叫間共用：Good/Warning 為唯讀範本，Critical 為 dict，
+    呼叫端只可讀取、不可修改（需要可修改的資料時，請如 assess_wound_api() 另行複製）。
+    """
+    return assess(wound_area, pain_level, exudate_level)
+
+
 # ===========================
 # 執行控制層 (Execution Control Layer)
 # ===========================
 
-def run_single_case(wound_area, pain_level, exudate_level) -> None:
+def run_single_case(wound_area: Any, pain_level: Any, exudate_level: Any, out: Optional[TextIO] = None) -> None:
     """
     執行單個評估案例並輸出結果到 Console
 
-    此函數負責呼叫 API、接收結果並格式化輸出。
+    此函數負責呼叫評估核心流程、接收結果並格式化輸出。
     根據評估成功或失敗，選擇對應的輸出格式。
 
     Args:
         wound_area: 傷口面積（任意型別）
         pain_level: 疼痛等級（任意型別）
         exudate_level: 滲液量（任意型別）
+        out: 輸出串流，預設為 None（即呼叫當下的 sys.stdout）
 
     Returns:
-        None（結果直接輸出到標準輸出）
+        None（結果直接輸出到 out）
     """
-    # 呼叫 API 進行評估
-    api_result = assess_wound_api(wound_area, pain_level, exudate_level)
+    # 呼叫核心流程進行評估（不需建立 API 外層的 dict）
+    is_valid, error_msg, assessment_result = _assess_wound_core(wound_area, pain_level, exudate_level)
 
     # 根據成功或失敗選擇輸出格式
-    if not api_result["success"]:
+    if not is_valid:
         # 輸入驗證失敗：輸出錯誤訊息
-        print(format_error_output(api_result["error"]))
+        print(format_error_output(error_msg), file=out)
     else:
         # 評估成功：輸出評估結果
-        print(format_assessment_output(api_result["data"]))
+        print(format_assessment_output(assessment_result), file=out)
 
 
 # ===========================
 # 測試資料層 (Test Data Layer)
 # ===========================
 
-def get_test_cases() -> List[Dict[str, object]]:
-    """
-    獲取完整的測試案例資料集
+# 測試案例資料表：每列為 (woundArea, painLevel, exudateLevel)，便於逐案例標註預期結果
+_TEST_CASE_ROWS = (
+    # =====================================
+    # 第一類：正常案例（5 個）
+    # =====================================
+    (1.5, 2, "None"),
+    # 預期: Good（面積 1.5 < 2, 疼痛 2 < 3, 滲液 None）
 
-    測試案例涵蓋三大類別：
-    1. 正常案例：測試三種評估狀態（Good/Warning/Critical）的典型情況
-    2. 邊界值測試：測試閾值邊界的處理（等於 vs 大於/小於）
-    3. 異常輸入：測試輸入驗證的健壯性
+    (3.0, 4, "Light"),
+    # 預期: Warning（面積 3 介於 2~5 之間）
 
-    Returns:
-        List[Dict]: 測試案例列表，每個案例為包含 woundArea, painLevel, exudateLevel 的字典
-    """
-    return [
-        # =====================================
-        # 第一類：正常案例（5 個）
-        # =====================================
-        {"woundArea": 1.5, "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Good（面積 1.5 < 2, 疼痛 2 < 3, 滲液 None）
+    (6.0, 2, "Moderate"),
+    # 預期: Critical（面積 6 > 5）
 
-        {"woundArea": 3.0, "painLevel": 4, "exudateLevel": "Light"},
-        # 預期: Warning（面積 3 介於 2~5 之間）
+    (1.0, 8, "None"),
+    # 預期: Critical（疼痛 8 > 7）
 
-        {"woundArea": 6.0, "painLevel": 2, "exudateLevel": "Moderate"},
-        # 預期: Critical（面積 6 > 5）
+    (2.0, 3, "Heavy"),
+    # 預期: Critical（滲液為 Heavy）
 
-        {"woundArea": 1.0, "painLevel": 8, "exudateLevel": "None"},
-        # 預期: Critical（疼痛 8 > 7）
+    # =====================================
+    # 第二類：邊界值測試（8 個）
+    # =====================================
+    (5.0, 2, "None"),
+    # 預期: Warning（面積 = 5，不觸發 Critical 的 > 5 條件）
 
-        {"woundArea": 2.0, "painLevel": 3, "exudateLevel": "Heavy"},
-        # 預期: Critical（滲液為 Heavy）
+    (5.01, 2, "None"),
+    # 預期: Critical（面積 5.01 > 5，剛好觸發）
 
-        # =====================================
-        # 第二類：邊界值測試（8 個）
-        # =====================================
-        {"woundArea": 5.0, "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Warning（面積 = 5，不觸發 Critical 的 > 5 條件）
+    (2.0, 7, "None"),
+    # 預期: Warning（疼痛 = 7，不觸發 Critical 的 > 7 條件）
 
-        {"woundArea": 5.01, "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Critical（面積 5.01 > 5，剛好觸發）
+    (2.0, 7.01, "None"),
+    # 預期: Critical（疼痛 7.01 > 7，剛好觸發）
 
-        {"woundArea": 2.0, "painLevel": 7, "exudateLevel": "None"},
-        # 預期: Warning（疼痛 = 7，不觸發 Critical 的 > 7 條件）
+    (2.0, 3, "Light"),
+    # 預期: Warning（疼痛 = 3，不符合 Good 的 < 3 條件）
 
-        {"woundArea": 2.0, "painLevel": 7.01, "exudateLevel": "None"},
-        # 預期: Critical（疼痛 7.01 > 7，剛好觸發）
+    (2.0, 2.99, "Light"),
+    # 預期: Good（疼痛 2.99 < 3，剛好符合）
 
-        {"woundArea": 2.0, "painLevel": 3, "exudateLevel": "Light"},
-        # 預期: Warning（疼痛 = 3，不符合 Good 的 < 3 條件）
+    (0, 0, "None"),
+    # 預期: Good（最小邊界值）
 
-        {"woundArea": 2.0, "painLevel": 2.99, "exudateLevel": "Light"},
-        # 預期: Good（疼痛 2.99 < 3，剛好符合）
+    (0, 10, "Heavy"),
+    # 預期: Critical（疼痛 = 10 最大值，滲液 Heavy，多重觸發）
 
-        {"woundArea": 0, "painLevel": 0, "exudateLevel": "None"},
-        # 預期: Good（最小邊界值）
+    # =====================================
+    # 第三類：異常輸入測試（7 個）
+    # =====================================
+    (-1, 2, "None"),
+    # 預期: Input Error（負數面積）
 
-        {"woundArea": 0, "painLevel": 10, "exudateLevel": "Heavy"},
-        # 預期: Critical（疼痛 = 10 最大值，滲液 Heavy，多重觸發）
+    (1, 11, "None"),
+    # 預期: Input Error（疼痛 > 10）
 
-        # =====================================
-        # 第三類：異常輸入測試（7 個）
-        # =====================================
-        {"woundArea": -1, "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Input Error（負數面積）
+    (1, -1, "None"),
+    # 預期: Input Error（疼痛 < 0）
 
-        {"woundArea": 1, "painLevel": 11, "exudateLevel": "None"},
-        # 預期: Input Error（疼痛 > 10）
+    (1, 2, "HIGH"),
+    # 預期: Input Error（無效的滲液值）
 
-        {"woundArea": 1, "painLevel": -1, "exudateLevel": "None"},
-        # 預期: Input Error（疼痛 < 0）
+    ("abc", 2, "None"),
+    # 預期: Input Error（非數字字串）
 
-        {"woundArea": 1, "painLevel": 2, "exudateLevel": "HIGH"},
-        # 預期: Input Error（無效的滲液值）
+    (1, "xyz", "None"),
+    # 預期: Input Error（非數字字串）
 
-        {"woundArea": "abc", "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Input Error（非數字字串）
+    (float('inf'), 2, "None"),
+    # 預期: Input Error（無限值）
+)
 
-        {"woundArea": 1, "painLevel": "xyz", "exudateLevel": "None"},
-        # 預期: Input Error（非數字字串）
+# 載入模組時轉置為欄位分離（Structure of Arrays）形式：(面積, 疼痛等級, 滲液量) 三個平行 tuple
+_TEST_CASES = tuple(zip(*_TEST_CASE_ROWS))
 
-        {"woundArea": float('inf'), "painLevel": 2, "exudateLevel": "None"},
-        # 預期: Input Error（無限值）
-    ]
 
+def get_test_cases() -> Tuple[Tuple[Any, ...], ...]:
+    """
+    獲取完整的測試案例資料集
 
-def run_all_tests() -> None:
+    測試案例涵蓋三大類別：
+    1. 正常案例：測試三種評估狀態（Good/Warning/Critical）的典型情況
+    2. 邊界值測試：測試閾值邊界的處理（等於 vs 大於/小於）
+    3. 異常輸入：測試輸入驗證的健壯性
+
+    Returns:
+        Tuple: (woundArea 序列, painLevel 序列, exudateLevel 序列) 三個等長的平行 tuple，
+        同一索引即為同一個測試案例
+    """
+    return _TEST_CASES
+
+
+def run_all_tests(out: Optional[TextIO] = None) -> None:
     """
     執行所有內建測試案例
 
     此函數負責批次執行所有測試案例並輸出結果。
     測試案例包含正常案例、邊界值測試和異常輸入。
+    每個案例皆透過 run_single_case() 執行，與互動式模式走相同的 API 流程；
+    所有輸出先寫入記憶體緩衝區，最後一次寫出，避免逐行輸出的額外負擔。
+
+    Args:
+        out: 輸出串流，預設為 None（即呼叫當下的 sys.stdout）
     """
-    test_cases = get_test_cases()
+    test_cases = list(zip(*get_test_cases()))
     total_cases = len(test_cases)
 
+    # 輸出緩衝區：寫入記憶體，不觸發實際的輸出
+    buffer = io.StringIO()
+
     # 輸出測試開始標題
-    print("=" * 70)
-    print("開始執行內建測試案例")
-    print(f"總計 {total_cases} 個案例")
-    print("=" * 70)
+    print("=" * 70, file=buffer)
+    print("開始執行內建測試案例", file=buffer)
+    print(f"總計 {total_cases} 個案例", file=buffer)
+    print("=" * 70, file=buffer)
 
     # 逐一執行每個測試案例
-    for case_index, test_case in enumerate(test_cases, start=1):
-        print(f"\n[測試案例 {case_index}/{total_cases}]")
-        print(f"輸入: woundArea={test_case['woundArea']}, " +
-              f"painLevel={test_case['painLevel']}, " +
-              f"exudateLevel={test_case['exudateLevel']}")
-        print("-" * 70)
-
-        # 執行評估並輸出結果
-        run_single_case(
-            test_case["woundArea"],
-            test_case["painLevel"],
-            test_case["exudateLevel"]
-        )
+    for case_index, (wound_area, pain_level, exudate_level) in enumerate(test_cases, start=1):
+        print(f"\n[測試案例 {case_index}/{total_cases}]", file=buffer)
+        print(f"輸入: woundArea={wound_area}, " +
+              f"painLevel={pain_level}, " +
+              f"exudateLevel={exudate_level}", file=buffer)
+        print("-" * 70, file=buffer)
+
+        # 執行評估並輸出結果至緩衝區
+        run_single_case(wound_area, pain_level, exudate_level, out=buffer)
 
     # 輸出測試完成標題
-    print("\n" + "=" * 70)
-    print(f"測試完成 (共執行 {total_cases} 個案例)")
-    print("=" * 70)
+    print("\n" + "=" * 70, file=buffer)
+    print(f"測試完成 (共執行 {total_cases} 個案例)", file=buffer)
+    print("=" * 70, file=buffer)
+
+    # 一次寫出所有結果
+    (out if out is not None else sys.stdout).write(buffer.getvalue())
 
 
 def input_wound_area() -> float:
@@ -594,21 +782,33 @@ def run_interactive_mode() -> None:
 # 主程式進入點 (Main Entry Point)
 # ===========================
 
-def main():
+def main(argv: Optional[Sequence[str]] = None) -> None:
     """
     主程式進入點
 
     執行流程：
-    1. 先執行所有內建測試案例（20 個）
-    2. 再進入互動式輸入模式，供使用者手動測試
+    1. 若指定 --test，先執行所有內建測試案例（20 個）
+    2. 進入互動式輸入模式，供使用者手動測試
+
+    Args:
+        argv: 命令列參數，預設為 None（即使用 sys.argv[1:]）
 
     異常處理：
     - KeyboardInterrupt: 使用者中斷（Ctrl+C）
     - Exception: 其他未預期的錯誤
     """
+    parser = argparse.ArgumentParser(description="傷口評估系統（Wound Assessment System）")
+    parser.add_argument(
+        "--test",
+        action="store_true",
+        help="進入互動式輸入模式前，先執行所有內建測試案例"
+    )
+    args = parser.parse_args(argv)
+
     try:
-        # 步驟 1: 執行內建測試案例
-        run_all_tests()
+        # 步驟 1: 執行內建測試案例（僅在指定 --test 時）
+        if args.test:
+            run_all_tests()
 
         # 步驟 2: 進入互動式輸入模式
         run_interactive_mode()
@@ -620,7 +820,6 @@ def main():
     except Exception as error:
         # 捕獲其他未預期的錯誤
         print(f"\n發生未預期的錯誤：{error}")
-        import traceback
         traceback.print_exc()
 
 
@@ -0,0 +1,17 @@
+from setuptools import setup
+from mypyc.build import mypycify
+
+
+# ===========================
+# 選用：以 mypyc 將 main.py 預先編譯為 C 擴充模組
+# ===========================
+#
+# 編譯方式：pip install mypy setuptools && python setup.py build_ext --inplace
+# 編譯後會在 main.py 旁產生 main.*.so；`import main` 會優先載入擴充模組，
+# 未編譯時則照常使用 main.py，兩者 API 完全相同。
+
+setup(
+    name="wound-assessment",
+    py_modules=["main", "assess_numba"],
+    ext_modules=mypycify(["main.py"]),
+)